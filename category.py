@@ -3,17 +3,43 @@
 """Generate Wikipedia Category to All Link Page Dictionary.
 """
 import pickle
-from collections import defaultdict
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Mapping
+from itertools import chain
+import codecs
 import gzip
+import hashlib
 import os
 import re
+import sys
 import urllib.request as urllib
 
-re_parentheses = re.compile("\((\d+),\d+,'?([^,']+)'?,[^\)]+\)")
-re_categorylinks = re.compile("\((\d+),'?([^,']+)'?,'?([^,']+)'?,'?([^,']+)'?,'?([^,']+)'?,'?([^,']+)'?,'?([^,']+)'?[^\)]+\)")
+try:
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
+
+# Quoted values are matched in "unrolled loop" form, which cannot backtrack and accepts empty or escaped values.
+SQL_STRING = r"'([^'\\]*(?:\\.[^'\\]*)*)'"
+SQL_ESCAPES = {'0': '\0', 'b': '\b', 'n': '\n', 'r': '\r', 't': '\t', 'Z': '\x1a'}
+re_parentheses = re.compile(r"\((\d+),\d+," + SQL_STRING + r",[^\)]+\)")
+re_categorylinks = re.compile(r"\((\d+)," + ",".join([SQL_STRING] * 6) + r"[^\)]*\)")
+re_sql_escape = re.compile(r"\\(.)", re.DOTALL)
 
 URL_PAGES = ('https://dumps.wikimedia.org/jawiki/latest/jawiki-latest-page.sql.gz')
 URL_CATEGORYLINKS = ('https://dumps.wikimedia.org/jawiki/latest/jawiki-latest-categorylinks.sql.gz')
+CHUNK_SIZE = 4 << 20
+SIGNATURE_PATH = 'dumps.sig'
 HIRAGANA = set(map(chr, range(12353, 12353+86)))
 KATAKANA = set(map(chr, range(12449, 12449+90)))
 
@@ -27,6 +53,61 @@ def download():
             urllib.urlretrieve(url, os.path.basename(url))
 
 
+def open_gzip(path):
+    """Open gzipped file, decompressing in parallel when rapidgzip is available.
+
+    Args:
+        path (String): gzipped data path.
+
+    Return:
+        f (File): binary file object for decompressed data.
+    """
+    if rapidgzip is not None:
+        return rapidgzip.open(path, parallelization=os.cpu_count())
+    return gzip.GzipFile(path)
+
+
+def iter_matches(pattern, path, errors='strict'):
+    """Iterate regular expression matches over gzipped dump data chunk by chunk.
+
+    Args:
+        pattern (Pattern): compiled regular expression for a record.
+        path (String): gzipped dump data path.
+        errors (String): decode error handling scheme.
+
+    Return:
+        groups (Iterator[Tuple[String]]): matched groups for each record.
+    """
+    decoder = codecs.getincrementaldecoder('utf8')(errors=errors)
+    buf = ''
+    with open_gzip(path) as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            final = not chunk
+            buf += decoder.decode(chunk, final=final)
+            # Each INSERT statement is on one line, so no record spans the last line break.
+            end = len(buf) if final else buf.rfind('\n') + 1
+            for m in pattern.finditer(buf, 0, end):
+                yield m.groups()
+            if final:
+                return
+            buf = buf[end:]
+
+
+def unescape_sql(value):
+    """Return SQL string literal value with backslash escapes resolved.
+
+    Args:
+        value (String): quoted value in dump data without surrounding quotes.
+
+    Return:
+        value (String): unescaped value.
+    """
+    if '\\' not in value:
+        return value
+    return re_sql_escape.sub(lambda m: SQL_ESCAPES.get(m.group(1), m.group(1)), value)
+
+
 def extract_id_title(path):
     """Extract id and title to Wikipedia pages dump.
 
@@ -36,8 +117,8 @@ def extract_id_title(path):
     Retunr:
         id2title (Hash[String, String]): page id to page title dictionary.
     """
-    with gzip.GzipFile(path) as f:
-        id2title = dict(re_parentheses.findall(f.read().decode('utf8')))
+    # Titles are interned so that the same object is shared by every category link.
+    id2title = {page_id: sys.intern(unescape_sql(title)) for page_id, title in iter_matches(re_parentheses, path)}
     return id2title
 
 
@@ -52,29 +133,115 @@ def extract_categorylinks(id2title, path):
         categorypages (Hash[String, Set[String]]): category to page titles dictionary.
         categorygraph (Hash[String, Set[String]]): category to sub categories dictionary.
     """
-    categorypages = defaultdict(set)
-    categorygraph = defaultdict(set)
-    with gzip.GzipFile(path) as f:
-        for (from_id, to, from_name, _, _, _, category_type) in re_categorylinks.findall(f.read().decode('utf8', errors='ignore')):
-            if from_id in id2title:
-                _from = id2title[from_id]
-
-                if category_type == 'subcat':
-                    if _from == to:
-                        continue
-                    categorygraph[to].add(_from)
-                else:
-                    categorypages[to].add(_from)
+    # Plain dictionaries avoid calling defaultdict's factory through Python on every new category.
+    categorypages = {}
+    categorygraph = {}
+    get_pages = categorypages.get
+    get_subcategories = categorygraph.get
+    for (from_id, to, from_name, _, _, _, category_type) in iter_matches(re_categorylinks, path, errors='ignore'):
+        _from = id2title.get(from_id)
+        if _from is not None:
+            to = sys.intern(unescape_sql(to))
+            if category_type == 'subcat':
+                if _from == to:
+                    continue
+                subcategories = get_subcategories(to)
+                if subcategories is None:
+                    subcategories = categorygraph[to] = set()
+                subcategories.add(_from)
             else:
-                print("Invalid ID:", from_id, from_name)
-    return categorypages, categorygraph
+                pages = get_pages(to)
+                if pages is None:
+                    pages = categorypages[to] = set()
+                pages.add(_from)
+        else:
+            print("Invalid ID:", from_id, from_name)
+    return defaultdict(set, categorypages), defaultdict(set, categorygraph)
+
 
+def _to_csr(graph, n):
+    """Return CSR (compressed sparse row) arrays of the graph.
 
-def topological_sort_dfs(categorygraph):
+    Args:
+        graph (Hash[Int, Set[Int]]): node index to successor indices dictionary.
+        n (Int): number of nodes.
+
+    Return:
+        indptr (Array[Int]): offsets of successors of each node in indices.
+        indices (Array[Int]): successor node indices.
+    """
+    indptr = array('l', [0]) * (n + 1)
+    indices = array('I')
+    for v in range(n):
+        if v in graph:
+            indices.extend(graph[v])
+        indptr[v + 1] = len(indices)
+    return indptr, indices
+
+
+class CSRGraph(Mapping):
+    """Read only graph of node indices stored in CSR arrays.
+
+    Args:
+        indptr (Array[Int]): offsets of successors of each node in indices.
+        indices (Array[Int]): successor node indices.
+    """
+    def __init__(self, indptr, indices):
+        self.indptr = indptr
+        self.indices = indices
+
+    def __getitem__(self, v):
+        if not isinstance(v, int) or not 0 <= v < len(self):
+            raise KeyError(v)
+        return self.indices[self.indptr[v]:self.indptr[v + 1]]
+
+    def __iter__(self):
+        return iter(range(len(self)))
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def transpose(self):
+        """Return the graph with all edges reversed.
+
+        Return:
+            graph (CSRGraph): transposed graph.
+        """
+        n = len(self)
+        indptr = array('l', [0]) * (n + 1)
+        for w in self.indices:
+            indptr[w + 1] += 1
+        for v in range(n):
+            indptr[v + 1] += indptr[v]
+
+        pos = indptr[:-1]
+        indices = array('I', [0]) * len(self.indices)
+        for v in range(n):
+            for k in range(self.indptr[v], self.indptr[v + 1]):
+                w = self.indices[k]
+                indices[pos[w]] = v
+                pos[w] += 1
+        return CSRGraph(indptr, indices)
+
+
+def _all_nodes(categorygraph):
+    """Return all nodes appearing in the graph.
+
+    Args:
+        categorygraph (Hash[T, Set[T]]): category to category list dictionary.
+
+    Return:
+        nodes (Set[T]): nodes appearing as keys or values.
+    """
+    return set(categorygraph).union(*categorygraph.values())
+
+
+def topological_sort_dfs(categorygraph, nodes=None):
     """Return topological sorted list (DFS algorithm in  Cormen's book).
 
     Args:
         categorygraph (Hash[T, Set[T]]): category to category list dictionary.
+        nodes (Set[T]): all nodes of the graph, computed from categorygraph if omitted.
 
     Return:
         L (List[T]): topological sorted list.
@@ -90,89 +257,190 @@ def topological_sort_dfs(categorygraph):
     def visit(v):
         if V[v].permanent:
             return
-        if V[v].temporary:
-            raise Exception("Graph has at least one cycle")
 
+        # Explicit stack of (node, iterator over unvisited children) instead of recursion.
         V[v].temporary = True
-        if v in categorygraph:
-            for m in categorygraph[v]:
-                visit(m)
+        stack = [(v, iter(categorygraph.get(v, ())))]
+        while stack:
+            v, children = stack[-1]
+            for m in children:
+                if V[m].permanent:
+                    continue
+                if V[m].temporary:
+                    raise Exception("Graph has at least one cycle")
+                V[m].temporary = True
+                stack.append((m, iter(categorygraph.get(m, ()))))
+                break
+            else:
+                stack.pop()
+                V[v].temporary = False
+                V[v].permanent = True
+                L.append(v)
 
-        V[v].temporary = False
-        V[v].permanent = True
-        L.insert(0, v)
+    if nodes is None:
+        nodes = _all_nodes(categorygraph)
 
-    nodes = set()
-    for v in categorygraph.values():
-        nodes |= set(v)
-    nodes |= set(categorygraph.keys())
-
-    while len(nodes) != 0:
-        v = nodes.pop()
+    for v in nodes:
         visit(v)
 
+    L.reverse()
     return L
 
 
-def decompose_scc(categorygraph):
+def _tarjan_csr(indptr, indices):
+    """Return strongly connected component id of each node (Tarjan's algorithm on CSR adjacency).
+
+    Args:
+        indptr (Array[Int]): offsets of successors of each node in indices.
+        indices (Array[Int]): successor node ids.
+
+    Return:
+        comp_of (Array[Int]): component id of each node, numbered in the order components are found.
+        n_comp (Int): number of components.
+    """
+    n = indptr.shape[0] - 1
+    index = np.full(n, -1, dtype=np.int64)
+    lowlink = np.zeros(n, dtype=np.int64)
+    on_stack = np.zeros(n, dtype=np.bool_)
+    comp_of = np.full(n, -1, dtype=np.int64)
+    S = np.empty(n, dtype=np.int64)
+    # Explicit call stack of nodes and positions of their next successor in indices.
+    call = np.empty(n, dtype=np.int64)
+    pos = np.empty(n, dtype=np.int64)
+
+    i = 0
+    n_comp = 0
+    sp = 0
+    for root in range(n):
+        if index[root] != -1:
+            continue
+
+        index[root] = i
+        lowlink[root] = i
+        i += 1
+        S[sp] = root
+        sp += 1
+        on_stack[root] = True
+        call[0] = root
+        pos[0] = indptr[root]
+        cp = 1
+        while cp > 0:
+            v = call[cp - 1]
+            p = pos[cp - 1]
+            if p < indptr[v + 1]:
+                pos[cp - 1] = p + 1
+                w = indices[p]
+                if index[w] == -1:
+                    index[w] = i
+                    lowlink[w] = i
+                    i += 1
+                    S[sp] = w
+                    sp += 1
+                    on_stack[w] = True
+                    call[cp] = w
+                    pos[cp] = indptr[w]
+                    cp += 1
+                elif on_stack[w] and index[w] < lowlink[v]:
+                    lowlink[v] = index[w]
+            else:
+                cp -= 1
+                if cp > 0:
+                    u = call[cp - 1]
+                    if lowlink[v] < lowlink[u]:
+                        lowlink[u] = lowlink[v]
+
+                if lowlink[v] == index[v]:
+                    while True:
+                        sp -= 1
+                        w = S[sp]
+                        on_stack[w] = False
+                        comp_of[w] = n_comp
+                        if w == v:
+                            break
+                    n_comp += 1
+
+    return comp_of, n_comp
+
+
+if numba is not None:
+    _tarjan_csr = numba.njit(cache=True)(_tarjan_csr)
+
+
+def decompose_scc(categorygraph, nodes=None):
     """Return strongly connected components (Tarjan's algorithm).
 
     Args:
         categorygraph (Hash[T, Set[T]]): category to category list dictionary.
+        nodes (Set[T]): all nodes of the graph, computed from categorygraph if omitted.
 
     Return:
         L (List[Set[T]]): strongly connected components list.
     """
-    class Node(object):
-        def __init__(self):
-            self.index = None
-            self.lowlink = None
-            self.onStack = False
+    if nodes is None:
+        nodes = _all_nodes(categorygraph)
+
+    # Node states are kept in parallel arrays indexed by integer node ids.
+    nodes = list(nodes)
+    node2id = {v: k for k, v in enumerate(nodes)}
+    adj = [[node2id[w] for w in categorygraph.get(v, ())] for v in nodes]
+    n = len(nodes)
+
+    if numba is not None:
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum([len(a) for a in adj], out=indptr[1:])
+        indices = np.fromiter(chain.from_iterable(adj), dtype=np.int64, count=indptr[-1])
+        comp_of, n_comp = _tarjan_csr(indptr, indices)
+        L = [set() for _ in range(n_comp)]
+        for v, c in zip(nodes, comp_of.tolist()):
+            L[c].add(v)
+        return L
+
+    index = array('l', [-1]) * n
+    lowlink = array('l', [0]) * n
+    on_stack = bytearray(n)
 
     i = 0
     L = []
     S = []
-    V = defaultdict(Node)
-
-    def strong_connect(v):
-        nonlocal i
-        nonlocal V
-        nonlocal S
-        nonlocal L
+    for root in range(n):
+        if index[root] != -1:
+            continue
 
-        V[v].index = i
-        V[v].lowlink = i
+        # Explicit stack of (node, iterator over remaining successors) instead of recursion.
+        index[root] = lowlink[root] = i
         i += 1
-        S.append(v)
-        V[v].onStack = True
-
-        if v in categorygraph:
-            for w in categorygraph[v]:
-                if V[w].index is None:
-                    strong_connect(w)
-                    V[v].lowlink = min(V[v].lowlink, V[w].lowlink)
-                elif V[w].onStack:
-                    V[v].lowlink = min(V[v].lowlink, V[w].index)
-
-        if V[v].lowlink == V[v].index:
-            new_c = set()
-            w = S.pop()
-            V[w].onStack = False
-            new_c.add(w)
-            while v != w:
-                w = S.pop()
-                V[w].onStack = False
-                new_c.add(w)
-            L.append(new_c)
-
-    nodes = set()
-    for v in categorygraph.values():
-        nodes |= set(v)
-    nodes |= set(categorygraph.keys())
-
-    for v in nodes:
-        if V[v].index is None:
-            strong_connect(v)
+        S.append(root)
+        on_stack[root] = True
+        stack = [(root, iter(adj[root]))]
+        while stack:
+            v, successors = stack[-1]
+            for w in successors:
+                if index[w] == -1:
+                    index[w] = lowlink[w] = i
+                    i += 1
+                    S.append(w)
+                    on_stack[w] = True
+                    stack.append((w, iter(adj[w])))
+                    break
+                elif on_stack[w] and index[w] < lowlink[v]:
+                    lowlink[v] = index[w]
+            else:
+                stack.pop()
+                if stack:
+                    u = stack[-1][0]
+                    if lowlink[v] < lowlink[u]:
+                        lowlink[u] = lowlink[v]
+
+                if lowlink[v] == index[v]:
+                    new_c = set()
+                    w = S.pop()
+                    on_stack[w] = False
+                    new_c.add(nodes[w])
+                    while v != w:
+                        w = S.pop()
+                        on_stack[w] = False
+                        new_c.add(nodes[w])
+                    L.append(new_c)
 
     return L
 
@@ -189,22 +457,27 @@ def _update_categorygraph(categorypages, categorygraph, category2indices):
         categorygraph (Hash[Int, Set[Int]]): updated categorygraph for containing all reachable content.
         categorypages (Hash[Int, Set[String]]): category index to page name list dictionary.
     """
-    updated_categorygraph = defaultdict(set)
-    inversed_categorygraph = defaultdict(set)
-
+    n_nodes = max(category2indices.values()) + 1 if category2indices else 0
+    children = defaultdict(set)
     for c in categorygraph:
+        i = category2indices[c]
         for v in categorygraph[c]:
-            updated_categorygraph[category2indices[c]].add(category2indices[v])
-            inversed_categorygraph[category2indices[v]].add(category2indices[c])
-        # Remove self loop
-        updated_categorygraph[category2indices[c]] -= set([category2indices[c]])
-        inversed_categorygraph[category2indices[c]] -= set([category2indices[c]])
-    sorted_list = topological_sort_dfs(updated_categorygraph)
-
-    for n in reversed(sorted_list):
-        if n in inversed_categorygraph:
-            for v in inversed_categorygraph[n]:
-                updated_categorygraph[v] |= updated_categorygraph[n]
+            j = category2indices[v]
+            # Remove self loop
+            if i != j:
+                children[i].add(j)
+
+    # The condensed graph is traversed as contiguous CSR arrays instead of dictionaries of sets.
+    updated_graph = CSRGraph(*_to_csr(children, n_nodes))
+    del children
+    inversed_graph = updated_graph.transpose()
+    sorted_list = topological_sort_dfs(updated_graph, nodes=range(n_nodes))
+
+    # Reachable sets are inserted in reversed topological order, so iterating items visits every child before its parents.
+    updated_categorygraph = defaultdict(set, ((n, set(updated_graph[n])) for n in reversed(sorted_list)))
+    for n, reachable_n in updated_categorygraph.items():
+        for v in inversed_graph[n]:
+            updated_categorygraph[v] |= reachable_n
 
     updated_categorypages = defaultdict(set)
     for node, i in category2indices.items():
@@ -227,11 +500,11 @@ def update_categorygraph_without_scc(categorypages, categorygraph):
         category2indices (Hash[String, Int]): category to category index list dictionary.
     """
 
-    categories = set()
-    for k in categorygraph:
-        categories |= categorygraph[k]
-    categories |= set(categorygraph.keys())
-    categories = list(categories)
+    # Frequently linked categories get small indices, and ties are ordered by name for reproducible output.
+    freq = Counter(categorygraph.keys())
+    for v in categorygraph.values():
+        freq.update(v)
+    categories = sorted(freq, key=lambda c: (-freq[c], c))
     category2indices = {c: i for i, c in enumerate(categories)}
 
     updated_categorygraph, updated_categorypages = _update_categorygraph(categorypages, categorygraph, category2indices)
@@ -271,42 +544,74 @@ def show_category_directlinks(categorypages, categorygraph, category):
         print("Pages:", categorypages[category])
 
 
-def show_category_alllinks_with_dfs(categorypages, categorygraph, category):
+def build_index2categories(category2indices):
+    """Return category index to categories dictionary.
+
+    Build it once and pass it to show_category_alllinks functions when showing many categories.
+
+    Args:
+        category2indices (Hash[String, Int]): category to category index list dictionary.
+
+    Return:
+        index2categories (Hash[Int, Set[String]]): category index to categories dictionary.
+    """
+    index2categories = defaultdict(set)
+    for c, i in category2indices.items():
+        index2categories[i].add(c)
+    return index2categories
+
+
+def show_category_alllinks_with_dfs(categorypages, categorygraph, category, category2indices=None, closure=None,
+                                    index2categories=None):
     """Print all link pages and sub categories under the category.
 
+    Reachable categories are read from closure when it is given, otherwise they are searched from categorygraph.
+
     Args:
         categorypages (Hash[String, Set[String]]): category to page titles dictionary.
         categorygraph (Hash[String, Set[String]]): category to sub categories dictionary.
         category (String): target category name.
+        category2indices (Hash[String, Int]): category to category index list dictionary.
+        closure (Hash[Int, Set[Int]]): categorygraph updated by update_categorygraph.
+        index2categories (Hash[Int, Set[String]]): result of build_index2categories, built from category2indices if omitted.
     """
-    class Node(object):
-        def __init__(self):
-            self.visited = False
-
-    V = defaultdict(Node)
     categories = set()
     pages = set()
 
-    def visit(v):
-        nonlocal pages
-        nonlocal categories
+    if closure is not None and category2indices is not None:
+        if category in category2indices:
+            if index2categories is None:
+                index2categories = build_index2categories(category2indices)
+            index = category2indices[category]
+            scc = index2categories[index]
+            categories = set().union(*[index2categories[i] for i in closure[index]])
+            if len(scc) > 1:
+                categories |= scc
+            for v in categories | scc:
+                if v in categorypages:
+                    pages |= categorypages[v]
+        elif category in categorypages:
+            # Categories without sub or parent categories have no index but may still have pages.
+            pages |= categorypages[category]
+    else:
+        visited = set()
+        stack = [category]
+        while stack:
+            v = stack.pop()
+            if v in visited:
+                continue
+            visited.add(v)
+            if v in categorypages:
+                pages |= categorypages[v]
+            if v in categorygraph:
+                categories |= categorygraph[v]
+                stack.extend(categorygraph[v])
 
-        if V[v].visited:
-            return
-        V[v].visited = True
-        if v in categorypages:
-            pages |= categorypages[v]
-        if v in categorygraph:
-            categories |= categorygraph[v]
-            for m in categorygraph[v]:
-                visit(m)
-
-    visit(category)
     print("Sub Categories:", categories)
     print("Pages:", pages)
 
 
-def show_category_alllinks(categorypages, categorygraph, category2indices, category):
+def show_category_alllinks(categorypages, categorygraph, category2indices, category, index2categories=None):
     """Print all link pages and sub categories under the category.
 
     Args:
@@ -314,20 +619,14 @@ def show_category_alllinks(categorypages, categorygraph, category2indices, categ
         categorygraph (Hash[Int, Set[Int]]): category index to sub categories dictionary.
         category2indices (Hash[String, Int]): category to category index list dictionary.
         category (String): target category name.
+        index2categories (Hash[Int, Set[String]]): result of build_index2categories, built from category2indices if omitted.
     """
-    index2categories = defaultdict(set)
-    for c, i in category2indices.items():
-        index2categories[i].add(c)
-
     if category in category2indices:
+        if index2categories is None:
+            index2categories = build_index2categories(category2indices)
         index = category2indices[category]
-        categories = []
-        pages = [categorypages[index]]
-        for sub_c in categorygraph[index]:
-            categories.append(sub_c)
-            pages.append(categorypages[sub_c])
-        categories = set().union(*[index2categories[i] for i in categories])
-        pages = set().union(*pages)
+        categories = set().union(*(index2categories[i] for i in categorygraph[index]))
+        pages = set().union(*(categorypages[i] for i in (index, *categorygraph[index])))
         print("Sub Categories:", categories)
         print("Pages:", pages)
 
@@ -346,13 +645,104 @@ def load(path):
     return obj
 
 
+def write_streaming(obj, path):
+    """Write dictionary to sets into gzipped file one item at a time.
+
+    Items are encoded by msgpack when it is available, otherwise they are pickled one by one.
+    Unlike write, no memo of the whole dictionary is kept while writing.
+
+    Args:
+        obj (Hash[T, Set[U]]): dictionary to write.
+        path (String): gzipped output path.
+    """
+    print('write: %s' % path)
+    with gzip.open(path, 'wb') as f:
+        if msgpack is not None:
+            packer = msgpack.Packer()
+            for k, v in obj.items():
+                f.write(packer.pack((k, list(v))))
+        else:
+            for item in obj.items():
+                pickle.dump(item, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_streaming(path):
+    """Load dictionary to sets written by write_streaming.
+
+    Args:
+        path (String): gzipped input path.
+
+    Return:
+        obj (Hash[T, Set[U]]): loaded dictionary.
+    """
+    print('load: %s' % path)
+    obj = defaultdict(set)
+    with gzip.open(path, 'rb') as f:
+        # Pickled items start with PROTO opcode, while msgpack items start with an array header.
+        if f.peek(1)[:1] == b'\x80':
+            while True:
+                try:
+                    k, v = pickle.load(f)
+                except EOFError:
+                    break
+                obj[k] = v
+        elif f.peek(1):
+            if msgpack is None:
+                raise ImportError("msgpack is required to load %s" % path)
+            # max_buffer_size=0 allows records beyond the 100 MiB default, as reachable sets of top categories can be.
+            for k, v in msgpack.Unpacker(f, use_list=False, raw=False, max_buffer_size=0):
+                obj[k] = set(v)
+    return obj
+
+
+def dump_signature(paths):
+    """Return signature of dump files computed from their names, sizes and modification times.
+
+    Args:
+        paths (List[String]): dump data paths.
+
+    Return:
+        signature (String): hex digest of the dump files.
+    """
+    h = hashlib.sha256()
+    for path in paths:
+        stat = os.stat(path)
+        h.update(('%s:%d:%d\n' % (os.path.basename(path), stat.st_size, stat.st_mtime_ns)).encode('utf8'))
+    return h.hexdigest()
+
+
+def is_up_to_date(signature, outputs):
+    """Return whether outputs exist and were generated from the dumps having the signature.
+
+    Args:
+        signature (String): signature of current dump files.
+        outputs (List[String]): generated data paths.
+
+    Return:
+        up_to_date (Bool): True if the outputs need not be generated again.
+    """
+    if not all(os.path.exists(path) for path in outputs + [SIGNATURE_PATH]):
+        return False
+    with open(SIGNATURE_PATH) as f:
+        return f.read().strip() == signature
+
+
 if __name__ == '__main__':
     download()
-    id2title = extract_id_title(path='jawiki-latest-page.sql.gz')
-    categorypages, categorygraph = extract_categorylinks(id2title, path='jawiki-latest-categorylinks.sql.gz')
-    write(categorypages, path='categorypages.pkl')
-    write(categorygraph, path='categorygraph.pkl')
-    categorygraph, categorypages, category2indices = update_categorygraph(categorypages, categorygraph)
-    write(categorygraph, path='categorygraph_all.pkl')
-    write(categorypages, path='categorypages_all.pkl')
-    write(category2indices, path='category2indices.pkl')
+    dumps = ['jawiki-latest-page.sql.gz', 'jawiki-latest-categorylinks.sql.gz']
+    outputs = ['categorypages.pkl', 'categorygraph.pkl', 'categorygraph_all.gz', 'categorypages_all.gz', 'category2indices.pkl']
+    signature = dump_signature(dumps)
+    if is_up_to_date(signature, outputs):
+        print('skip: outputs are up to date with %s' % SIGNATURE_PATH)
+    else:
+        id2title = extract_id_title(path=dumps[0])
+        categorypages, categorygraph = extract_categorylinks(id2title, path=dumps[1])
+        write(categorypages, path='categorypages.pkl')
+        write(categorygraph, path='categorygraph.pkl')
+        categorygraph, categorypages, category2indices = update_categorygraph(categorypages, categorygraph)
+        write_streaming(categorygraph, path='categorygraph_all.gz')
+        write_streaming(categorypages, path='categorypages_all.gz')
+        write(category2indices, path='category2indices.pkl')
+        # Signature is written last, so interrupted runs are not treated as up to date.
+        with open(SIGNATURE_PATH, 'w') as f:
+            f.write(signature)